@@ -19,6 +19,11 @@ MIN_AGE = 40
 MAX_VALUE_LEN = 64
 YEAR_RANGE_LOWER = 2014
 YEAR_RANGE_UPPER = 2024
+# Sequences shorter than this count their codons with a plain dict instead of a Counter
+SHORT_SEQUENCE_LENGTH = 128
+# Output files written at once by Loader.create_outputs; the writes are I/O bound,
+# so a few threads are enough to overlap encoding with writing
+MAX_OUTPUT_WRITERS = 4
 VALID_DATE_FORMATS = [
     "%Y-%m-%d",  # 2024-01-15
     "%d/%m/%Y",  # 15/01/2024
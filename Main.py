@@ -2,6 +2,8 @@ import argparse
 import os
 import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from typing import Iterable, TextIO
 from Pipeline.ETLOrchestrator import ETLOrchestrator
 
 
@@ -11,11 +13,25 @@ def main():
     :return:
         None: Function exits the program with appropriate exit code
     """
+    sys.exit(run_pipeline(sys.argv[1:]))
+
+
+def run_pipeline(argv : list[str]) -> int:
+    """
+    Parse the command line arguments and run the pipeline in the requested mode.
+    Can be called in-process (e.g. by tests or benchmarks) without starting a new interpreter.
+
+    :param argv: Command line arguments, excluding the program name
+    :return:
+        int: Exit code, 0 if all files processed successfully, 1 otherwise
+    """
     parser = argparse.ArgumentParser(
         description="Run the pipeline orchestrator with a JSON configuration file"
     )
     parser.add_argument(
-        "config_path", help="Path to the JSON configuration file for the pipeline"
+        "config_path",
+        nargs="?",
+        help="Path to the JSON configuration file for the pipeline",
     )
     parser.add_argument(
         "mode",
@@ -31,24 +47,43 @@ def main():
         type=int,
         help="Number of threads to use for parallel processing",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Read configuration file paths from stdin, one per line, and report one result line per file",
+    )
+    parser.add_argument(
+        "--soa",
+        action="store_true",
+        help="Write the per-sequence results as parallel arrays under 'sequences_soa'",
+    )
+    args = parser.parse_args(argv)
+
+    if args.batch:
+        orchestrator = ETLOrchestrator(soa=args.soa)
+        success = process_batch(orchestrator, sys.stdin)
+        return 0 if success else 1
+    if args.config_path is None:
+        parser.error("config_path is required unless --batch is given")
 
     if os.path.isfile(args.config_path):
-        orchestrator = ETLOrchestrator()
+        orchestrator = ETLOrchestrator(soa=args.soa)
         success = process_single_file(orchestrator, args.config_path)
-        sys.exit(0 if success else 1)
+        return 0 if success else 1
     elif os.path.isdir(args.config_path) and (args.mode == "sequential"):
-        orchestrator = ETLOrchestrator()
+        orchestrator = ETLOrchestrator(soa=args.soa)
         success = process_directory(orchestrator, args.config_path)
-        sys.exit(0 if success else 1)
+        return 0 if success else 1
     elif os.path.isdir(args.config_path) and args.mode == "concurrent":
-        success = process_directory_concurrent(args.config_path, args.num_threads)
-        sys.exit(0 if success else 1)
+        success = process_directory_concurrent(
+            args.config_path, args.num_threads, args.soa
+        )
+        return 0 if success else 1
     else:
         print(
             f"\n ✗ Error: '{args.config_path}' is neither a regular file nor a directory."
         )
-        sys.exit(1)
+        return 1
 
 
 def process_single_file(orchestrator : ETLOrchestrator, file_path : str) -> bool:
@@ -81,30 +116,28 @@ def process_directory(orchestrator : ETLOrchestrator, directory_path : str) -> b
     Note:
         Processing stops on first failure but continues to process remaining files.
     """
-    all_items = os.listdir(directory_path)
-    json_files = [item for item in all_items if item.lower().endswith(".json")]
+    json_files = find_json_files(directory_path)
     if not json_files:
         print(f"\n ✗ No JSON files found in directory '{directory_path}'")
         return False
-    successful_files = []
-    failed_files = []
-    for json_file in json_files:
-        full_path = os.path.join(directory_path, json_file)
-        result = orchestrator.orchestrate(full_path)
-        if result[0] == 0:
-            successful_files.append(json_file)
-        else:
-            failed_files.append((json_file, result[1]))
+    results = (
+        (json_file, *orchestrator.orchestrate(os.path.join(directory_path, json_file)))
+        for json_file in json_files
+    )
+    successful_files, failed_files = split_results(results)
     print_summary_report(directory_path, successful_files, failed_files, "Sequential")
     return len(failed_files) == 0
 
 
-def process_directory_concurrent(directory_path : str, num_threads : int) -> bool:
+def process_directory_concurrent(
+    directory_path : str, num_threads : int, soa : bool = False
+) -> bool:
     """
     Process all JSON files in a directory concurrently using multiple threads.
 
     :param directory_path: Path to directory containing JSON configuration files
     :param num_threads: Number of worker threads to use for parallel processing
+    :param soa: Write the per-sequence results as parallel arrays
 
     :return:
         bool: True if all files processed successfully, False if any file failed or no JSON files found
@@ -113,35 +146,94 @@ def process_directory_concurrent(directory_path : str, num_threads : int) -> boo
         - Each worker thread creates its own ETLOrchestrator instance to avoid thread safety issues
         - Uses ThreadPoolExecutor for managed thread pool execution
     """
-    all_items = os.listdir(directory_path)
-    json_files = [item for item in all_items if item.lower().endswith(".json")]
+    json_files = find_json_files(directory_path)
     if not json_files:
         print(f"\n ✗ No JSON files found in directory '{directory_path}'")
         return False
 
-    successful_files = []
-    failed_files = []
-
     with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        future_to_file = {
-            executor.submit(process_file_worker, directory_path, json_file): json_file
+        futures = [
+            executor.submit(process_file_worker, directory_path, json_file, soa)
             for json_file in json_files
-        }
-
-        for future in as_completed(future_to_file):
-            file_path, status_code, message = future.result()
-            file_name = os.path.basename(file_path)
-
-            if status_code == 0:
-                successful_files.append(file_name)
-            else:
-                failed_files.append((file_name, message))
+        ]
+        results = (
+            (os.path.basename(file_path), status_code, message)
+            for file_path, status_code, message in (
+                future.result() for future in as_completed(futures)
+            )
+        )
+        successful_files, failed_files = split_results(results)
 
     print_summary_report(directory_path, successful_files, failed_files, "Concurrent")
 
     return len(failed_files) == 0
 
 
+def process_batch(orchestrator : ETLOrchestrator, input_stream : TextIO) -> bool:
+    """
+    Process JSON configuration files whose paths are read one per line from a stream,
+    reusing a single ETL orchestrator instance for all of them. The DNA processor's codon
+    statistics are reset before each file, so every result matches a standalone run.
+
+    :param orchestrator: The ETL orchestrator instance to use for processing
+    :param input_stream: Text stream providing one configuration file path per line
+    :return:
+        bool: True if all files processed successfully, False if any file failed
+
+    Note:
+        - Writes exactly one line per file to stdout: "OK" on success, "ERR: <message>" on failure
+        - Pipeline progress messages are sent to stderr so they don't interleave with result lines
+    """
+    all_successful = True
+    for line in input_stream:
+        file_path = line.strip()
+        if not file_path:
+            continue
+        orchestrator.DNA_processor.reset()
+        with redirect_stdout(sys.stderr):
+            result = orchestrator.orchestrate(file_path)
+        if result[0] == 0:
+            print("OK", flush=True)
+        else:
+            all_successful = False
+            print(f"ERR: {result[1]}", flush=True)
+    return all_successful
+
+
+def find_json_files(directory_path : str) -> list[str]:
+    """
+    Find the JSON configuration files directly inside a directory.
+
+    :param directory_path: Path to directory containing JSON configuration files
+    :return:
+        list[str]: Names of the JSON files found (not full paths)
+    """
+    return [item for item in os.listdir(directory_path) if item.lower().endswith(".json")]
+
+
+def split_results(
+    results : Iterable[tuple[str, int, str]]
+) -> tuple[list[str], list[tuple[str, str]]]:
+    """
+    Split per-file processing results into successful and failed files, so every
+    directory mode reports its outcome the same way.
+
+    :param results: Iterable of (file_name, status_code, message) tuples
+    :return:
+        tuple[list[str], list[tuple[str, str]]]: A tuple containing:
+            - list[str]: Names of successfully processed files
+            - list[tuple[str, str]]: (file_name, error_message) for failed files
+    """
+    successful_files = []
+    failed_files = []
+    for file_name, status_code, message in results:
+        if status_code == 0:
+            successful_files.append(file_name)
+        else:
+            failed_files.append((file_name, message))
+    return successful_files, failed_files
+
+
 def print_summary_report(directory_path : str, successful_files : int, failed_files : int, mode : str) -> None:
     """
     Print a formatted summary report of file processing results.
@@ -156,33 +248,41 @@ def print_summary_report(directory_path : str, successful_files : int, failed_fi
     failure_count = len(failed_files)
     success_rate = (success_count / total_files) * 100 if total_files > 0 else 0
 
-    print(f"PROCESSING SUMMARY - {mode} Mode")
-    print(f"{'=' * 60}")
-    print(f"Directory: {directory_path}")
-    print(f"Total files processed: {total_files}")
-    print(f"✓ Successful: {success_count}")
-    print(f"✗ Failed: {failure_count}")
-    print(f"Success rate: {success_rate:.1f}%")
+    # Build the whole report first and write it at once, instead of flushing line by line
+    lines = [
+        f"PROCESSING SUMMARY - {mode} Mode",
+        f"{'=' * 60}",
+        f"Directory: {directory_path}",
+        f"Total files processed: {total_files}",
+        f"✓ Successful: {success_count}",
+        f"✗ Failed: {failure_count}",
+        f"Success rate: {success_rate:.1f}%",
+    ]
 
     if failed_files:
-        print(f"\nFailed files:")
+        lines.append(f"\nFailed files:")
         for file_name, error_msg in failed_files:
-            print(f"  • {file_name}: {error_msg}")
+            lines.append(f"  • {file_name}: {error_msg}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def process_file_worker(directory_path : str, json_file : str) -> tuple[str, int, str]:
+def process_file_worker(
+    directory_path : str, json_file : str, soa : bool = False
+) -> tuple[str, int, str]:
     """
     Worker function for processing a single JSON file in a thread-safe manner.
 
     :param directory_path: Path to the directory containing the JSON file
     :param json_file: Name of the JSON file to process (not the full path)
+    :param soa: Write the per-sequence results as parallel arrays
     :return:
         tuple[str, int, str]: A tuple containing:
             - str: Full path to the processed file
             - int: Status code (0 for success, non-zero for failure)
             - str: Result message or error description
     """
-    orchestrator = ETLOrchestrator()
+    orchestrator = ETLOrchestrator(soa=soa)
     full_path = os.path.join(directory_path, json_file)
     result = orchestrator.orchestrate(full_path)
     return full_path, result[0], result[1]
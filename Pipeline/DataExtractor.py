@@ -1,9 +1,23 @@
 import json
+import re
 from typing import Tuple
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional, the stdlib parser is used without it
+    from json import loads as json_loads
+
+try:
+    import simdjson
+except ImportError:  # pysimdjson is optional, json_loads is used without it
+    simdjson = None
+
 from Pipeline.DataModels import ValidPaths
 from Pipeline.DataModels.DNAData import DNAData
 
+# Digit runs long enough to hold an integer wider than 64 bits
+_WIDE_INTEGER = re.compile(rb"\d{19,}")
+
 
 class DataExtractor:
     """
@@ -12,6 +26,13 @@ class DataExtractor:
     This class provides methods to read JSON metadata files and plain text DNA
     sequence files, returning structured data objects for further processing.
 
+    Attributes:
+        _opener (Callable): Opens data files in the given mode, the builtin open by default.
+                            Tests may pass one that returns in-memory streams.
+        _json_parser (simdjson.Parser): Reusable metadata parser when pysimdjson is
+                                        installed, None otherwise. Not thread safe, so
+                                        each thread uses its own DataExtractor.
+
     Methods:
         extract(paths: ValidPaths) -> Tuple[dict, DnaData]:
             Coordinates the extraction of both metadata and DNA data from specified file paths.
@@ -23,6 +44,10 @@ class DataExtractor:
             Reads DNA sequences from a text file and stores them in a DnaData object.
     """
 
+    def __init__(self, opener=open):
+        self._opener = opener
+        self._json_parser = simdjson.Parser() if simdjson is not None else None
+
     def extract(self, paths: ValidPaths) -> Tuple[dict, DNAData]:
         """
         Coordinates the extraction of both metadata and DNA data from specified file paths.
@@ -43,9 +68,23 @@ class DataExtractor:
         :param metadata_path: Path to the JSON metadata file
         :return: Parsed metadata as a dictionary
         """
-        with open(metadata_path, "r") as metadata_file:
-            metadata = json.load(metadata_file)
-            return metadata
+        # Parse the raw UTF-8 bytes, skipping the decode to str
+        with self._opener(metadata_path, "rb") as metadata_file:
+            raw_metadata = metadata_file.read()
+        # The fast parsers turn integers wider than 64 bits into floats or reject them,
+        # so documents that may hold one are left to the stdlib parser to keep them exact
+        if _WIDE_INTEGER.search(raw_metadata) is None:
+            try:
+                if self._json_parser is not None:
+                    # Reuse the parser's buffers, materializing plain dicts and lists
+                    return self._json_parser.parse(raw_metadata, True)
+                return json_loads(raw_metadata)
+            except (ValueError, RuntimeError):
+                # Numbers out of the fast parsers' range, and malformed documents,
+                # are parsed (or reported) by the stdlib parser
+                pass
+        metadata = json.loads(raw_metadata)
+        return metadata
 
     def _extract_dna(self, dna_file_path: str) -> DNAData:
         """
@@ -57,8 +96,9 @@ class DataExtractor:
         :return: DNAData object containing the parsed DNA sequences
         """
         dna_data = DNAData()
-        with open(dna_file_path, "r") as dna_file:
-            for line in dna_file.readlines():
-                if line.strip() != "":
-                    dna_data.sequences.append(line.strip())
+        with self._opener(dna_file_path, "r") as dna_file:
+            # Iterate the text mode stream, stripping each line once and dropping empty ones
+            dna_data.sequences = [
+                stripped for line in dna_file if (stripped := line.strip())
+            ]
         return dna_data
@@ -23,7 +23,8 @@ class ETLOrchestrator:
         data_extractor (DataExtractor): Extracts data from validated input files
         DNA_processor (DNAProcessor): Transforms and processes DNA sequence data
         MetaData_processor (MetaDataProcessor): Processes and sanitizes metadata
-        loader (Loader): Handles output file generation and data persistence
+        loader (Loader): Handles output file generation and data persistence, writing the
+                         per-sequence results as parallel arrays when soa is set
         metadata_validator (MetaDataValidator): Validates metadata content.
 
     Methods:
@@ -31,12 +32,12 @@ class ETLOrchestrator:
              Executes the complete data processing pipeline for a given input path.
     """
 
-    def __init__(self):
+    def __init__(self, soa: bool = False):
         self.input_validator = InputValidator(valid_keys=VALID_INPUT_KEYS)
         self.data_extractor = DataExtractor()
         self.DNA_processor = DNAProcessor()
         self.MetaData_processor = MetaDataProcessor()
-        self.loader = Loader()
+        self.loader = Loader(soa=soa)
         self.metadata_validator = MetaDataValidator()
         self.exception_translator = StatusCodeExceptionTranslator(valid_exceptions)
 
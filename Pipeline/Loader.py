@@ -1,5 +1,14 @@
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib encoder is used without it
+    orjson = None
+
+from Constants import MAX_OUTPUT_WRITERS
 from Exceptions.LoaderExceptions import LoaderException
 from Pipeline.DataModels.ValidPaths import ValidPaths
 
@@ -9,11 +18,21 @@ class Loader:
     Responsible for formatting processed DNA data and metadata into a structured
     output format and saving it as a JSON file with processing metadata included.
 
+    Attributes:
+        soa (bool): Write the per-sequence results as parallel arrays under "sequences_soa"
+                    instead of a list of objects under "sequences". Disabled by default.
+
     Methods:
         create_output(meta_data : dict, dna_data : dict, paths : ValidPaths, start_time : datetime, end_time : datetime, participant_id : str) -> None:
             Creates and saves a structured output file containing processed genetic data and processing metadata.
+
+        create_outputs(jobs : Iterable[tuple]) -> None:
+            Creates the output files of several participants concurrently.
     """
 
+    def __init__(self, soa: bool = False):
+        self.soa = soa
+
     def create_output(
         self,
         meta_data: dict,
@@ -38,11 +57,20 @@ class Loader:
             - Creates/overwrites file at paths.output_path
             - Prints success/error messages to console
         """
+        # Fail before building and encoding the document when the output directory is missing.
+        output_dir = os.path.dirname(os.fspath(paths.output_path)) or "."
+        if not os.path.isdir(output_dir):
+            raise LoaderException(participant_id)
+        # Timestamps are stringified up front, so the encoders only see JSON-native types.
+        start_str = str(start_time)
+        end_str = str(end_time)
+        if self.soa:
+            dna_data = self._to_soa(dna_data)
         # Create a dictionary containing processed data as required.
         output = {
             "metadata": {
-                "start_at": str(start_time),
-                "end_at": str(end_time),
+                "start_at": start_str,
+                "end_at": end_str,
                 "context_path": str(paths.context_path),
                 "results_path": str(paths.output_path),
             },
@@ -56,8 +84,75 @@ class Loader:
         }
         # Loads the dictionary content as Json to the output path.
         try:
-            with open(paths.output_path, "w+") as f:
-                json.dump(output, f, indent=4)
+            # Encode the whole document first, handing it to the file in one write.
+            # Both encoders indent by 2 spaces, the only indent orjson supports.
+            if orjson is not None:
+                encoded_output = orjson.dumps(
+                    output, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            else:
+                encoded_output = json.dumps(output, indent=2, ensure_ascii=False).encode(
+                    "utf-8"
+                )
+            with self._open(paths.output_path) as f:
+                f.write(encoded_output)
             print(f"Output saved successfully to: {paths.output_path}")
         except Exception as e:
             raise LoaderException(participant_id)
+
+    def _open(self, output_path: str):
+        """
+        Opens the output file for writing the encoded document.
+
+        :param output_path: Path of the output file
+        :return: Binary file object, created or truncated
+        """
+        return open(output_path, "wb")
+
+    @staticmethod
+    def _to_soa(dna_data: dict) -> dict:
+        """
+        Transposes the per-sequence results into one array per field, so the encoder walks a
+        few homogeneous lists instead of repeating every key for every sequence.
+
+        :param dna_data: Transformed DNA sequence data
+        :return: Copy of dna_data with "sequences" replaced by "sequences_soa", or dna_data
+                 itself unless "sequences" is a list of dicts sharing the same fields
+        """
+        sequences = dna_data.get("sequences")
+        if not isinstance(sequences, list) or not all(
+            isinstance(sequence, dict) for sequence in sequences
+        ):
+            return dna_data
+        fields = list(sequences[0]) if sequences else []
+        if any(list(sequence) != fields for sequence in sequences):
+            return dna_data
+        sequences_soa = {field: [] for field in fields}
+        for sequence in sequences:
+            for field in fields:
+                sequences_soa[field].append(sequence[field])
+        # Copy the other results as they are, keeping their order
+        soa_data = {}
+        for key, value in dna_data.items():
+            if key == "sequences":
+                soa_data["sequences_soa"] = sequences_soa
+            else:
+                soa_data[key] = value
+        return soa_data
+
+    def create_outputs(self, jobs: Iterable[tuple]) -> None:
+        """
+        Creates the output files of several participants concurrently, so one participant's
+        JSON encoding overlaps with another's file write. Each job writes to its own output path.
+        A library API for callers holding several transformed participants at once; the
+        command line modes save each participant from its own orchestrate call.
+
+        :param jobs: create_output argument tuples, each
+                     (meta_data, dna_data, paths, start_time, end_time, participant_id)
+        :raises LoaderException: For the first job (in input order) whose output could not be
+                                 saved, once every job has been attempted
+        """
+        with ThreadPoolExecutor(max_workers=MAX_OUTPUT_WRITERS) as executor:
+            futures = [executor.submit(self.create_output, *job) for job in jobs]
+        for future in futures:
+            future.result()
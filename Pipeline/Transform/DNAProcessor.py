@@ -1,10 +1,18 @@
-from itertools import combinations
+import sys
+from collections import Counter
+from itertools import product
 
 import Levenshtein
 from Levenshtein import matching_blocks
 
+from Constants import SHORT_SEQUENCE_LENGTH
 from Pipeline.DataModels.DNAData import DNAData
 
+# One shared string object per ACGT codon, reused as the key in every codons map
+_CODON_INTERN = {
+    "".join(bases): sys.intern("".join(bases)) for bases in product("ACGT", repeat=3)
+}
+
 
 class DNAProcessor:
     """
@@ -16,8 +24,14 @@ class DNAProcessor:
     Attributes:
         codon_frequencies (dict): Global accumulator tracking codon occurrences
                                  across all analyzed sequences
+        _top_codon (str): Most common codon so far, maintained while counting
+        _top_count (int): Global occurrences of the most common codon
+        _codon_ranks (dict): First-seen order of each codon, used to break ties
 
     Methods:
+        reset() -> None:
+            Clears the global codon statistics.
+
         transform_dna(dna_data: DNAData) -> dict:
             Main processing method that coordinates all DNA analysis operations.
 
@@ -32,7 +46,16 @@ class DNAProcessor:
     """
 
     def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """
+        Clears the global codon statistics accumulated by previous transformations.
+        """
         self.codon_frequencies = {}
+        self._top_codon = None
+        self._top_count = 0
+        self._codon_ranks = {}
 
     def transform_dna(self, dna_data: DNAData) -> dict:
         """
@@ -41,21 +64,15 @@ class DNAProcessor:
         :param dna_data: DNAData object containing raw DNA sequences to analyze
         :return: Dictionary with sequences analysis, most common codon, and LCS information
         """
-        sequences_data = []
         # Individual sequence analysis
-        for sequence in dna_data.sequences:
-            analysis_result = self._analyze_sequence(sequence)
-            sequences_data.append(analysis_result)
+        analyze_sequence = self._analyze_sequence
+        sequences_data = [analyze_sequence(sequence) for sequence in dna_data.sequences]
 
         # Global pattern finding
         lcs_data = self._find_lcs(dna_data)
 
-        # Global codon analysis
-        most_common_codon = None
-        if self.codon_frequencies:
-            most_common_codon = max(
-                self.codon_frequencies, key=self.codon_frequencies.get
-            )
+        # Global codon analysis, tracked while counting codons
+        most_common_codon = self._top_codon
 
         return {
             "sequences": sequences_data,
@@ -70,19 +87,40 @@ class DNAProcessor:
         :param sequence: DNA sequence string to analyze
         :return: Dictionary containing GC content percentage and codon frequency map
         """
-        # GC content calculating
-        gc_count = 0
-        for nuc in sequence:
-            if nuc == "G" or nuc == "C":
-                gc_count += 1
-        gc_content = round((gc_count / len(sequence)) * 100, 2)
-
-        # Counting codons in the sequence, updating the global codons map
-        codons = {}
-        for i in range(0, len(sequence) - (len(sequence) % 3) - 2, 3):
-            codon = sequence[i : i + 3]
-            codons[codon] = codons.get(codon, 0) + 1
-            self.codon_frequencies[codon] = self.codon_frequencies.get(codon, 0) + 1
+        # GC content calculating, str.count scans the sequence in C
+        gc_count = sequence.count("G") + sequence.count("C")
+        gc_content = round((gc_count / len(sequence)) * 100, 2) if sequence else 0.0
+
+        # Counting codons in the sequence, stripping the incomplete trailing codon
+        codons_end = len(sequence) - len(sequence) % 3
+        if codons_end < SHORT_SEQUENCE_LENGTH:
+            # Counter's setup outweighs the counting itself on a handful of codons
+            codons = {}
+            for i in range(0, codons_end, 3):
+                codon = sequence[i : i + 3]
+                codons[codon] = codons.get(codon, 0) + 1
+        else:
+            codons = Counter(sequence[i : i + 3] for i in range(0, codons_end, 3))
+        # Key the results by the shared codon strings, once per distinct codon
+        codons = {
+            _CODON_INTERN.get(codon, codon): count for codon, count in codons.items()
+        }
+
+        # Updating the global codons map once per distinct codon, in first-seen order
+        codon_frequencies = self.codon_frequencies
+        codon_ranks = self._codon_ranks
+        top_codon, top_count = self._top_codon, self._top_count
+        for codon, sequence_count in codons.items():
+            count = codon_frequencies.get(codon, 0) + sequence_count
+            codon_frequencies[codon] = count
+            if count == sequence_count:
+                codon_ranks[codon] = len(codon_ranks)
+            # Keep the running most common codon, ties go to the codon seen first
+            if count > top_count or (
+                count == top_count and codon_ranks[codon] < codon_ranks[top_codon]
+            ):
+                top_codon, top_count = codon, count
+        self._top_codon, self._top_count = top_codon, top_count
 
         return {"gc_content": gc_content, "codons": codons}
 
@@ -101,32 +139,41 @@ class DNAProcessor:
         if len(dna_data.sequences) < 2:
             return {"value": "", "sequences": [], "length": 0}
 
-        # Iterating over all pairs of sequences.
-        all_results = []
-        for i, j in combinations(range(len(dna_data.sequences)), 2):
-            # Find the LCS of the current pair
-            lcs_value = self._longest_common_subsequence(
-                dna_data.sequences[i], dna_data.sequences[j]
-            )
-            # If an LCS exists for the current pair, find all sequences containing it and save it.
-            if lcs_value:
-                participants = [
-                    k + 1
-                    for k in range(len(dna_data.sequences))
-                    if lcs_value in dna_data.sequences[k]
-                ]
-                all_results.append(
-                    {
-                        "value": lcs_value,
-                        "sequences": participants,
-                        "length": len(lcs_value),
-                    }
-                )
+        # Iterating over all pairs of sequences, keeping only the longest LCS values found.
+        sequences = dna_data.sequences
+        longest_common_subsequence = self._longest_common_subsequence
+        best_length = 0
+        candidates = []
+        num_sequences = len(sequences)
+        for i in range(num_sequences - 1):
+            for j in range(i + 1, num_sequences):
+                # Skip pairs too short to reach the longest LCS found so far
+                if min(len(sequences[i]), len(sequences[j])) < best_length:
+                    continue
+                # Find the LCS of the current pair
+                lcs_value = longest_common_subsequence(sequences[i], sequences[j])
+                if len(lcs_value) > best_length:
+                    best_length = len(lcs_value)
+                    candidates = [lcs_value]
+                elif lcs_value and len(lcs_value) == best_length:
+                    candidates.append(lcs_value)
         # Verify a LCS is found.
-        if not all_results:
+        if not candidates:
             return {"value": "", "sequences": [], "length": 0}
-        # Retrieve the LCS with maximum length (breaking ties by most participating sequences).
-        return max(all_results, key=lambda x: (x["length"], len(x["sequences"])))
+        # Only the longest candidates can win, so participating sequences are searched
+        # for those alone, once per distinct value (breaking ties by most participating sequences).
+        best_result = None
+        for lcs_value in dict.fromkeys(candidates):
+            participants = [
+                k + 1 for k in range(num_sequences) if lcs_value in sequences[k]
+            ]
+            if best_result is None or len(participants) > len(best_result["sequences"]):
+                best_result = {
+                    "value": lcs_value,
+                    "sequences": participants,
+                    "length": best_length,
+                }
+        return best_result
 
     def _longest_common_subsequence(self, seq1: str, seq2: str) -> str:
         """
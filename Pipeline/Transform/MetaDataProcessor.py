@@ -11,7 +11,7 @@ class MetaDataProcessor:
 
     def remove_private_keys(self, meta_data: dict) -> dict:
         """
-        Recursively removes all private keys from a metadata dictionary.
+        Removes all private keys from a metadata dictionary, including nested ones.
 
         Creates a sanitized copy of the input dictionary by filtering out keys that
         start with underscore ("_").
@@ -22,15 +22,25 @@ class MetaDataProcessor:
                   structure for non-private data
         """
         cleaned_dict = {}
-        for key, value in meta_data.items():
-            # Skip private key.
-            if key.startswith("_"):
-                continue
-            # Recursively clean nested dictionary
-            if isinstance(value, dict):
-                cleaned_dict[key] = self.remove_private_keys(value)
-            # Copy not private key into the new dictionary
-            else:
-                cleaned_dict[key] = value
+        if not meta_data:
+            return cleaned_dict
+        # Walk nested dictionaries with an explicit stack instead of recursive calls,
+        # pairing each source dictionary with the cleaned copy it fills
+        pending = [(meta_data, cleaned_dict)]
+        while pending:
+            source, cleaned = pending.pop()
+            for key, value in source.items():
+                # Skip private key.
+                if key[:1] == "_":
+                    continue
+                # Clean nested dictionary (subclasses included, so none leaks private keys)
+                if isinstance(value, dict):
+                    cleaned[key] = {}
+                    # An empty nested dictionary stays empty, no need to walk it
+                    if value:
+                        pending.append((value, cleaned[key]))
+                # Copy not private key into the new dictionary
+                else:
+                    cleaned[key] = value
 
         return cleaned_dict
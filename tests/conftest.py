@@ -1,13 +1,52 @@
+import copy
+import io
 import pytest
-import tempfile
 import json
+import shutil
 import uuid
 from pathlib import Path
+from Pipeline.DataExtractor import DataExtractor
+from Pipeline.Loader import Loader
 from Pipeline.DataModels.ValidPaths import ValidPaths
 from Pipeline.DataModels.DNAData import DNAData
 
+try:
+    from orjson import dumps as _dumps
+except ImportError:  # Fall back to the stdlib when orjson is not installed
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+
+# Module-level sample values; the fixtures below hand each test its own copy to mutate
+_SAMPLE_DNA_SEQUENCES = ("ATCGCGATCG", "GCTAGCTAGC", "TTAATTAATT", "CGCGCGCGCG")
+_SAMPLE_METADATA = {
+    "participant_id": "test-123",
+    "name": "John Doe",
+    "date_of_birth": "1980-05-15",
+    "age": 43,
+    "location": "Boston",
+    "study_id": "DNA-001",
+}
+_METADATA_WITH_PRIVATE_TEMPLATE = {
+    "participant_id": "test-123",
+    "name": "John Doe",
+    "_ssn": "123-45-6789",
+    "age": 43,
+    "_internal_id": "secret123",
+    "location": "Boston",
+    "contact": {"email": "john@example.com", "_phone": "555-1234"},
+}
+
+
+def pytest_configure(config):
+    """Register custom markers so test subsets can be selected with -m."""
+    config.addinivalue_line(
+        "markers", "integration: end-to-end tests that run the full pipeline on disk"
+    )
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_uuid():
     """Generate a sample UUID for testing."""
     return str(uuid.uuid4())
@@ -16,91 +55,119 @@ def sample_uuid():
 @pytest.fixture
 def sample_dna_sequences():
     """Provide sample DNA sequences for testing."""
-    return ["ATCGCGATCG", "GCTAGCTAGC", "TTAATTAATT", "CGCGCGCGCG"]
+    return list(_SAMPLE_DNA_SEQUENCES)
 
 
 @pytest.fixture
 def sample_metadata():
     """Provide sample metadata for testing."""
-    return {
-        "participant_id": "test-123",
-        "name": "John Doe",
-        "date_of_birth": "1980-05-15",
-        "age": 43,
-        "location": "Boston",
-        "study_id": "DNA-001",
-    }
+    return copy.deepcopy(_SAMPLE_METADATA)
 
 
 @pytest.fixture
 def sample_metadata_with_private():
     """Provide metadata with private keys for testing removal."""
-    return {
-        "participant_id": "test-123",
-        "name": "John Doe",
-        "_ssn": "123-45-6789",
-        "age": 43,
-        "_internal_id": "secret123",
-        "location": "Boston",
-        "contact": {"email": "john@example.com", "_phone": "555-1234"},
-    }
+    return copy.deepcopy(_METADATA_WITH_PRIVATE_TEMPLATE)
 
 
 @pytest.fixture
-def temp_dna_file(sample_dna_sequences):
-    """Create a temporary DNA file with sample sequences."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix="_dna.txt", delete=False) as f:
-        for seq in sample_dna_sequences:
-            f.write(seq + "\n")
-        return f.name
+def temp_dna_file(tmp_path, golden_participant_dir, sample_uuid):
+    """Create a temporary DNA file with sample sequences, copied from the golden tree."""
+    dna_file = tmp_path / "sample_dna.txt"
+    shutil.copyfile(golden_participant_dir / f"{sample_uuid}_dna.txt", dna_file)
+    return str(dna_file)
+
+
+@pytest.fixture
+def temp_metadata_file(tmp_path, golden_participant_dir, sample_uuid):
+    """Create a temporary metadata JSON file, copied from the golden tree."""
+    metadata_file = tmp_path / "sample_dna.json"
+    shutil.copyfile(golden_participant_dir / f"{sample_uuid}_dna.json", metadata_file)
+    return str(metadata_file)
+
+
+@pytest.fixture
+def output_path(tmp_path):
+    """Provide an output file path inside the test's temporary directory."""
+    return str(tmp_path / "out.json")
+
+
+class _CapturedOutput(io.BytesIO):
+    """In-memory output file that records its bytes under its path once closed."""
+
+    def __init__(self, outputs, output_path):
+        super().__init__()
+        self._outputs = outputs
+        self._output_path = output_path
+
+    def close(self):
+        if not self.closed:
+            self._outputs[self._output_path] = self.getvalue()
+        super().close()
+
+
+class _MemLoader(Loader):
+    """Loader that keeps its outputs in memory, keyed by output path, instead of on disk."""
+
+    def __init__(self, soa: bool = False):
+        super().__init__(soa)
+        self.outputs = {}
+
+    def _open(self, output_path):
+        return _CapturedOutput(self.outputs, output_path)
 
 
 @pytest.fixture
-def temp_metadata_file(sample_metadata):
-    """Create a temporary metadata JSON file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix="_dna.json", delete=False) as f:
-        json.dump(sample_metadata, f)
-        return f.name
+def mem_loader():
+    """Provide a Loader whose output bytes are captured in its outputs dict, not written to disk."""
+    return _MemLoader()
 
 
 @pytest.fixture
-def temp_input_file(sample_uuid):
-    """Create a temporary input JSON file for pipeline testing."""
+def make_input(tmp_path):
+    """Return a helper that writes a pipeline input JSON file under tmp_path."""
+
+    def _make_input(context_path, results_path):
+        input_file = tmp_path / f"input_{uuid.uuid4().hex}.json"
+        input_file.write_bytes(
+            _dumps({"context_path": context_path, "results_path": results_path})
+        )
+        return str(input_file)
+
+    return _make_input
+
+
+@pytest.fixture(scope="session")
+def golden_participant_dir(tmp_path_factory, sample_uuid):
+    """Build a canonical participant directory once per session, for tests to copy."""
+    participant_dir = tmp_path_factory.mktemp("golden") / sample_uuid
+    participant_dir.mkdir()
+
+    # Create DNA file
+    dna_file = participant_dir / f"{sample_uuid}_dna.txt"
+    with open(dna_file, "w") as f:
+        f.write("\n".join(_SAMPLE_DNA_SEQUENCES) + "\n")
 
-    def _create_input_file(context_path, results_path):
-        input_data = {"context_path": context_path, "results_path": results_path}
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(input_data, f)
-            return f.name
+    # Create metadata file
+    metadata_file = participant_dir / f"{sample_uuid}_dna.json"
+    metadata_file.write_bytes(_dumps(_SAMPLE_METADATA))
 
-    return _create_input_file
+    return participant_dir
 
 
 @pytest.fixture
-def temp_directory_with_files(sample_uuid, sample_dna_sequences, sample_metadata):
+def temp_directory_with_files(tmp_path, golden_participant_dir, sample_uuid):
     """Create a temporary directory with DNA and metadata files."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        participant_dir = Path(temp_dir) / sample_uuid
-        participant_dir.mkdir()
-
-        # Create DNA file
-        dna_file = participant_dir / f"{sample_uuid}_dna.txt"
-        with open(dna_file, "w") as f:
-            for seq in sample_dna_sequences:
-                f.write(seq + "\n")
-
-        # Create metadata file
-        metadata_file = participant_dir / f"{sample_uuid}_dna.json"
-        with open(metadata_file, "w") as f:
-            json.dump(sample_metadata, f)
-
-        yield {
-            "temp_dir": temp_dir,
-            "participant_dir": str(participant_dir),
-            "dna_file": str(dna_file),
-            "metadata_file": str(metadata_file),
-            "participant_id": sample_uuid,
-        }
+    participant_dir = tmp_path / sample_uuid
+    shutil.copytree(golden_participant_dir, participant_dir)
+
+    return {
+        "temp_dir": str(tmp_path),
+        "participant_dir": str(participant_dir),
+        "dna_file": str(participant_dir / f"{sample_uuid}_dna.txt"),
+        "metadata_file": str(participant_dir / f"{sample_uuid}_dna.json"),
+        "participant_id": sample_uuid,
+    }
 
 
 @pytest.fixture
@@ -122,19 +189,14 @@ def dna_data_fixture(sample_dna_sequences):
     return dna_data
 
 
-@pytest.fixture
-def cleanup_files():
-    """Cleanup fixture to remove temporary files after tests."""
-    files_to_cleanup = []
-
-    def add_file(file_path):
-        files_to_cleanup.append(file_path)
-
-    yield add_file
-
-    # Cleanup
-    for file_path in files_to_cleanup:
-        try:
-            Path(file_path).unlink()
-        except FileNotFoundError:
-            pass
+@pytest.fixture(scope="session")
+def real_fixture_extract():
+    """Extract the real fixture files once per session, returning (metadata, dna_data)."""
+    fixtures_dir = Path(__file__).parent / "fixtures"
+    paths = ValidPaths(
+        dna_path=str(fixtures_dir / "sample_dna.txt"),
+        metadata_path=str(fixtures_dir / "sample_metadata.json"),
+        context_path="/tmp/test",
+        output_path="/tmp/test_output.json",
+    )
+    return DataExtractor().extract(paths)
@@ -1,29 +1,116 @@
 import pytest
-import tempfile
 import json
 import os
+import uuid
 from pathlib import Path
+from types import MappingProxyType
 from Pipeline.ETLOrchestrator import ETLOrchestrator
 from Constants import VALID_INPUT_KEYS
 
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:  # Fall back to the stdlib when orjson is not installed
+    from json import loads as _loads
 
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+
+# Read-only metadata failing age validation, shared by the tests that need it
+_INVALID_METADATA = MappingProxyType(
+    {
+        "participant_id": "test-123",
+        "name": "Too Young",
+        "date_of_birth": "2010-01-01",  # Too young
+        "age": 13,
+        "location": "Boston",
+    }
+)
+
+
+def _has_private(obj):
+    """Return True if any dictionary nested in obj has a key starting with an underscore."""
+    if isinstance(obj, dict):
+        return any(k.startswith("_") for k in obj) or any(
+            _has_private(v) for v in obj.values()
+        )
+    if isinstance(obj, list):
+        return any(_has_private(x) for x in obj)
+    return False
+
+
+def _write_input(tmp_path, input_data):
+    """Write an input configuration under tmp_path and return its path."""
+    input_path = tmp_path / "input.json"
+    input_path.write_bytes(_dumps(input_data))
+    return str(input_path)
+
+
+def _missing_input_file(tmp_path):
+    """Input path that does not exist."""
+    return str(tmp_path / "nonexistent" / "path.json")
+
+
+def _invalid_json_input(tmp_path):
+    """Input file with malformed JSON."""
+    input_path = tmp_path / "invalid.json"
+    input_path.write_text("invalid json content")
+    return str(input_path)
+
+
+def _wrong_keys_input(tmp_path):
+    """Input file missing the required keys."""
+    return _write_input(tmp_path, {"wrong_key": "value"})
+
+
+def _missing_participant_input(tmp_path):
+    """Input file pointing to a participant directory that does not exist."""
+    return _write_input(
+        tmp_path,
+        {
+            "context_path": str(tmp_path / "nonexistent" / str(uuid.uuid4())),
+            "results_path": str(tmp_path / "test_output.json"),
+        },
+    )
+
+
+def _missing_dna_files_input(tmp_path):
+    """Input file pointing to a participant directory without data files."""
+    participant_dir = tmp_path / str(uuid.uuid4())
+    participant_dir.mkdir()
+    return _write_input(
+        tmp_path,
+        {
+            "context_path": str(participant_dir),
+            "results_path": str(tmp_path / "test_output.json"),
+        },
+    )
+
+
+@pytest.fixture(scope="class")
+def class_orchestrator(request):
+    """Create one orchestrator shared by all test methods of the requesting class."""
+    request.cls.orchestrator = ETLOrchestrator()
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures("class_orchestrator")
 class TestETLOrchestrator:
     """Integration tests for the ETL Orchestrator."""
 
-    def setup_method(self):
-        """Set up test fixtures for each test method."""
-        self.orchestrator = ETLOrchestrator()
+    @pytest.fixture(autouse=True)
+    def _reset_orchestrator(self):
+        """Clear the codon statistics the previous test accumulated."""
+        self.orchestrator.DNA_processor.reset()
 
     def test_orchestrate_valid_pipeline_success(
-        self, temp_directory_with_files, temp_input_file, cleanup_files
+        self, temp_directory_with_files, make_input, tmp_path
     ):
         """Test complete pipeline execution with valid data."""
         # Setup
         temp_data = temp_directory_with_files
-        output_file = "/tmp/test_output.json"
-        input_file = temp_input_file(temp_data["participant_dir"], output_file)
-        cleanup_files(input_file)
-        cleanup_files(output_file)
+        output_file = str(tmp_path / "test_output.json")
+        input_file = make_input(temp_data["participant_dir"], output_file)
 
         # Execute
         status_code, message = self.orchestrator.orchestrate(input_file)
@@ -34,96 +121,47 @@ class TestETLOrchestrator:
         assert "Pipline completed for participant ID:" in message
         assert Path(output_file).exists()
 
-    def test_orchestrate_missing_input_file(self):
-        """Test pipeline with non-existent input file."""
-        status_code, message = self.orchestrator.orchestrate("/nonexistent/path.json")
+    @pytest.mark.parametrize(
+        "build_input, expected",
+        [
+            (_missing_input_file, "does not exist"),
+            (_wrong_keys_input, "Input file don't match valid keys"),
+            (_missing_participant_input, "Context path does not exist"),
+            (_missing_dna_files_input, "Input file does not exist"),
+        ],
+        ids=[
+            "missing_input_file",
+            "missing_required_keys",
+            "invalid_participant_directory",
+            "missing_dna_files",
+        ],
+    )
+    def test_orchestrate_error_cases(self, build_input, expected, tmp_path):
+        """Test that invalid inputs fail the pipeline with a descriptive message."""
+        status_code, message = self.orchestrator.orchestrate(build_input(tmp_path))
 
         assert status_code == 1
-        assert "Input validation failed" in message or "does not exist" in message
+        assert expected in message
 
-    def test_orchestrate_invalid_json_format(self, cleanup_files):
+    def test_orchestrate_invalid_json_format(self, tmp_path):
         """Test pipeline with malformed JSON input."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("invalid json content")
-            invalid_json_path = f.name
-
-        cleanup_files(invalid_json_path)
-
-        status_code, message = self.orchestrator.orchestrate(invalid_json_path)
+        status_code, message = self.orchestrator.orchestrate(_invalid_json_input(tmp_path))
 
         assert status_code == 1
         assert message.startswith("Invalid JSON file")
 
-    def test_orchestrate_missing_required_keys(self, cleanup_files):
-        """Test pipeline with input missing required keys."""
-        input_data = {"wrong_key": "value"}
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(input_data, f)
-            input_path = f.name
-
-        cleanup_files(input_path)
-
-        status_code, message = self.orchestrator.orchestrate(input_path)
-
-        assert status_code == 1
-        assert "Input file don't match valid keys" in message
-
-    def test_orchestrate_invalid_participant_directory(
-        self, sample_uuid, temp_input_file, cleanup_files
-    ):
-        """Test pipeline with non-existent participant directory."""
-        fake_dir = f"/nonexistent/{sample_uuid}"
-        output_file = "/tmp/test_output.json"
-        input_file = temp_input_file(fake_dir, output_file)
-        cleanup_files(input_file)
-
-        status_code, message = self.orchestrator.orchestrate(input_file)
-
-        assert status_code == 1
-        assert "Context path does not exist" in message
-
-    def test_orchestrate_missing_dna_files(
-        self, sample_uuid, temp_input_file, cleanup_files
-    ):
-        """Test pipeline with missing DNA data files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            participant_dir = Path(temp_dir) / sample_uuid
-            participant_dir.mkdir()
-
-            output_file = "/tmp/test_output.json"
-            input_file = temp_input_file(str(participant_dir), output_file)
-            cleanup_files(input_file)
-            cleanup_files(output_file)
-
-            status_code, message = self.orchestrator.orchestrate(input_file)
-
-            assert status_code == 1
-            assert "Input file does not exist" in message
-
     def test_orchestrate_invalid_metadata_age(
-        self, temp_directory_with_files, temp_input_file, cleanup_files
+        self, temp_directory_with_files, make_input, tmp_path
     ):
         """Test pipeline with metadata validation failure (age too young)."""
         temp_data = temp_directory_with_files
 
         # Modify metadata to have invalid age
-        invalid_metadata = {
-            "participant_id": "test-123",
-            "name": "Too Young",
-            "date_of_birth": "2010-01-01",  # Too young
-            "age": 13,
-            "location": "Boston",
-        }
-
         metadata_file = Path(temp_data["metadata_file"])
-        with open(metadata_file, "w") as f:
-            json.dump(invalid_metadata, f)
+        metadata_file.write_bytes(_dumps(dict(_INVALID_METADATA)))
 
-        output_file = "/tmp/test_output.json"
-        input_file = temp_input_file(temp_data["participant_dir"], output_file)
-        cleanup_files(input_file)
-        cleanup_files(output_file)
+        output_file = str(tmp_path / "test_output.json")
+        input_file = make_input(temp_data["participant_dir"], output_file)
 
         status_code, message = self.orchestrator.orchestrate(input_file)
 
@@ -131,22 +169,19 @@ class TestETLOrchestrator:
         assert "Invalid participant age:" in message
 
     def test_orchestrate_timing_capture(
-        self, temp_directory_with_files, temp_input_file, cleanup_files
+        self, temp_directory_with_files, make_input, tmp_path
     ):
         """Test that pipeline captures processing timing correctly."""
         temp_data = temp_directory_with_files
-        output_file = "/tmp/test_output_timing.json"
-        input_file = temp_input_file(temp_data["participant_dir"], output_file)
-        cleanup_files(input_file)
-        cleanup_files(output_file)
+        output_file = str(tmp_path / "test_output_timing.json")
+        input_file = make_input(temp_data["participant_dir"], output_file)
 
         status_code, message = self.orchestrator.orchestrate(input_file)
 
         assert status_code == 0
 
         # Check that output file contains timing information
-        with open(output_file, "r") as f:
-            output_data = json.load(f)
+        output_data = _loads(Path(output_file).read_bytes())
 
         # Timing is in metadata section with different key names
         assert "start_at" in output_data["metadata"]
@@ -155,8 +190,8 @@ class TestETLOrchestrator:
     def test_orchestrate_metadata_privacy_removal(
         self,
         temp_directory_with_files,
-        temp_input_file,
-        cleanup_files,
+        make_input,
+        tmp_path,
         sample_metadata_with_private,
     ):
         """Test that private metadata keys are removed in output."""
@@ -164,23 +199,18 @@ class TestETLOrchestrator:
 
         # Use metadata with private keys
         metadata_file = Path(temp_data["metadata_file"])
-        with open(metadata_file, "w") as f:
-            json.dump(sample_metadata_with_private, f)
+        metadata_file.write_bytes(_dumps(sample_metadata_with_private))
 
-        output_file = "/tmp/test_output_privacy.json"
-        input_file = temp_input_file(temp_data["participant_dir"], output_file)
-        cleanup_files(input_file)
-        cleanup_files(output_file)
+        output_file = str(tmp_path / "test_output_privacy.json")
+        input_file = make_input(temp_data["participant_dir"], output_file)
 
         status_code, message = self.orchestrator.orchestrate(input_file)
 
         assert status_code == 0
 
         # Check that private keys are removed from output
-        with open(output_file, "r") as f:
-            output_data = json.load(f)
+        output_data = _loads(Path(output_file).read_bytes())
 
-        metadata_str = json.dumps(output_data)
-        assert "_ssn" not in metadata_str
-        assert "_internal_id" not in metadata_str
-        assert "_phone" not in metadata_str
+        # The output schema keys the participant as "_id", so only the metadata is walked
+        for result in output_data["results"]:
+            assert not _has_private(result["json"])
@@ -0,0 +1,81 @@
+import pytest
+import io
+import json
+import uuid
+
+import Main
+from Pipeline.ETLOrchestrator import ETLOrchestrator
+
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:  # Fall back to the stdlib when orjson is not installed
+    from json import loads as _loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+
+# Sequences dominated by a single codon, enough to shift any carried-over codon statistics
+SKEWED_DNA_SEQUENCES = ["AAAAAAAAAAAAAAAAAAAAAAAA", "AAAAAAAAAAAAAAAAAAAAAAAA"]
+
+
+def _make_participant(tmp_path, sequences, metadata):
+    """Create a participant directory named by a fresh UUID and return its path."""
+    participant_id = str(uuid.uuid4())
+    participant_dir = tmp_path / participant_id
+    participant_dir.mkdir()
+    (participant_dir / f"{participant_id}_dna.txt").write_text("\n".join(sequences) + "\n")
+    (participant_dir / f"{participant_id}_dna.json").write_bytes(_dumps(metadata))
+    return str(participant_dir)
+
+
+@pytest.mark.integration
+class TestMainBatch:
+    """Integration tests for batch processing of configuration paths read from a stream."""
+
+    def test_batch_reports_one_line_per_job(
+        self, tmp_path, temp_directory_with_files, make_input, capsys
+    ):
+        """Test that each job gets exactly one result line on stdout, with progress on stderr."""
+        valid_input = make_input(
+            temp_directory_with_files["participant_dir"], str(tmp_path / "valid.json")
+        )
+        missing_input = str(tmp_path / "nonexistent" / "input.json")
+        input_stream = io.StringIO(f"{valid_input}\n{missing_input}\n\n")
+
+        success = Main.process_batch(ETLOrchestrator(), input_stream)
+        captured = capsys.readouterr()
+
+        assert success is False
+        lines = captured.out.splitlines()
+        assert len(lines) == 2
+        assert lines[0] == "OK"
+        assert lines[1].startswith("ERR: ")
+        assert "Output saved successfully" in captured.err
+        assert "Output saved successfully" not in captured.out
+
+    def test_batch_identical_jobs_produce_identical_outputs(
+        self, tmp_path, temp_directory_with_files, sample_metadata, make_input, capsys
+    ):
+        """Test that a job's output does not depend on the jobs processed before it."""
+        participant_dir = temp_directory_with_files["participant_dir"]
+        first_output = tmp_path / "first.json"
+        second_output = tmp_path / "second.json"
+        skewed_dir = _make_participant(tmp_path, SKEWED_DNA_SEQUENCES, sample_metadata)
+        input_stream = io.StringIO(
+            "\n".join(
+                [
+                    make_input(participant_dir, str(first_output)),
+                    make_input(skewed_dir, str(tmp_path / "skewed.json")),
+                    make_input(participant_dir, str(second_output)),
+                ]
+            )
+        )
+
+        success = Main.process_batch(ETLOrchestrator(), input_stream)
+
+        assert success is True
+        assert capsys.readouterr().out.splitlines() == ["OK", "OK", "OK"]
+        first_results = _loads(first_output.read_bytes())["results"]
+        second_results = _loads(second_output.read_bytes())["results"]
+        assert first_results == second_results
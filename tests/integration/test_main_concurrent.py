@@ -0,0 +1,215 @@
+import pytest
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import uuid
+from pathlib import Path
+
+import Main
+
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:  # Fall back to the stdlib when orjson is not installed
+    from json import loads as _loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+
+VALID_METADATA = {
+    "participant_id": "concurrent-test",
+    "name": "John Doe",
+    "date_of_birth": "1980-05-15",
+    "age": 43,
+    "location": "Boston",
+    "study_id": "DNA-001",
+}
+INVALID_AGE_METADATA = {**VALID_METADATA, "date_of_birth": "2010-01-01", "age": 13}
+DNA_SEQUENCES = ["ATCGCGATCG", "GCTAGCTAGC", "TTAATTAATT", "CGCGCGCGCG"]
+GOLDEN_PARTICIPANTS = 10
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CMD = [sys.executable, "Main.py"]
+SUBPROCESS_ENV = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1", "PYTHONUNBUFFERED": "1"}
+_SUMMARY_RE = re.compile(
+    r"Total files processed: (\d+).*?Successful: (\d+).*?Failed: (\d+)"
+    r".*?Success rate: ([\d.]+)%",
+    re.S,
+)
+
+
+@pytest.fixture(scope="session")
+def golden_participants(tmp_path_factory):
+    """Build a canonical tree of valid participant directories once per session."""
+    root = tmp_path_factory.mktemp("golden_participants")
+    for _ in range(GOLDEN_PARTICIPANTS):
+        participant_id = str(uuid.uuid4())
+        participant_dir = root / participant_id
+        participant_dir.mkdir()
+
+        with open(participant_dir / f"{participant_id}_dna.txt", "w") as f:
+            f.write("\n".join(DNA_SEQUENCES) + "\n")
+
+        metadata_file = participant_dir / f"{participant_id}_dna.json"
+        metadata_file.write_bytes(_dumps(VALID_METADATA))
+    return root
+
+
+def create_test_directory_with_files(
+    base_dir, golden_dir, num_files, invalid_indices=()
+):
+    """
+    Copy participant directories from the golden tree and create one input configuration per participant.
+
+    :param base_dir: Directory to create the participants and configurations in
+    :param golden_dir: Session-wide tree of valid participant directories to copy from
+    :param num_files: Number of participants (and configuration files) to create
+    :param invalid_indices: Indices of participants whose metadata fails age validation
+    :return: Path to the directory containing the input configuration files
+    """
+    golden_participant_dirs = sorted(golden_dir.iterdir())
+    assert num_files <= len(golden_participant_dirs)
+    participants_dir = base_dir / "participants"
+    configs_dir = base_dir / "configs"
+    configs_dir.mkdir()
+    for i, golden_participant_dir in enumerate(golden_participant_dirs[:num_files]):
+        participant_id = golden_participant_dir.name
+        participant_dir = participants_dir / participant_id
+        shutil.copytree(golden_participant_dir, participant_dir)
+
+        if i in invalid_indices:
+            metadata_file = participant_dir / f"{participant_id}_dna.json"
+            metadata_file.write_bytes(_dumps(INVALID_AGE_METADATA))
+
+        input_data = {
+            "context_path": str(participant_dir),
+            "results_path": str(participant_dir / "output.json"),
+        }
+        (configs_dir / f"{participant_id}_input.json").write_bytes(_dumps(input_data))
+    return configs_dir
+
+
+@pytest.mark.integration
+class TestMainConcurrent:
+    """Integration tests for concurrent directory processing through Main."""
+
+    def test_concurrent_processing_all_valid(
+        self, tmp_path, golden_participants, capsys
+    ):
+        """Test that all valid files are processed successfully in concurrent mode."""
+        configs_dir = create_test_directory_with_files(tmp_path, golden_participants, 3)
+
+        exit_code = Main.run_pipeline([str(configs_dir), "concurrent"])
+        output = capsys.readouterr().out
+
+        assert exit_code == 0
+        assert "PROCESSING SUMMARY - Concurrent Mode" in output
+        assert _SUMMARY_RE.search(output).groups() == ("3", "3", "0", "100.0")
+        assert len(list((tmp_path / "participants").glob("*/output.json"))) == 3
+
+    def test_concurrent_processing_with_failures(
+        self, tmp_path, golden_participants, capsys
+    ):
+        """Test that failed files are reported without affecting the valid ones."""
+        configs_dir = create_test_directory_with_files(
+            tmp_path, golden_participants, 3, invalid_indices={1}
+        )
+
+        exit_code = Main.run_pipeline([str(configs_dir), "concurrent"])
+        output = capsys.readouterr().out
+
+        assert exit_code == 1
+        assert _SUMMARY_RE.search(output).groups() == ("3", "2", "1", "66.7")
+        assert "Invalid participant age:" in output
+
+    def test_concurrent_thread_pool_size(
+        self, tmp_path, golden_participants, capsys
+    ):
+        """Test concurrent processing with an explicit number of worker threads."""
+        configs_dir = create_test_directory_with_files(tmp_path, golden_participants, 10)
+
+        exit_code = Main.run_pipeline([str(configs_dir), "concurrent", "4"])
+        output = capsys.readouterr().out
+
+        assert exit_code == 0
+        assert _SUMMARY_RE.search(output).groups() == ("10", "10", "0", "100.0")
+
+    def test_concurrent_processing_error_isolation(
+        self, tmp_path, golden_participants, capsys
+    ):
+        """Test that invalid configuration files don't prevent processing of valid ones."""
+        configs_dir = create_test_directory_with_files(tmp_path, golden_participants, 3)
+        (configs_dir / "broken_input.json").write_text("invalid json content")
+        missing_participant = {
+            "context_path": str(tmp_path / "participants" / str(uuid.uuid4())),
+            "results_path": str(tmp_path / "missing_output.json"),
+        }
+        (configs_dir / "missing_input.json").write_bytes(_dumps(missing_participant))
+
+        exit_code = Main.run_pipeline([str(configs_dir), "concurrent"])
+        output = capsys.readouterr().out
+
+        assert exit_code == 1
+        assert _SUMMARY_RE.search(output).groups() == ("5", "3", "2", "60.0")
+        assert "broken_input.json: Invalid JSON file" in output
+        assert "missing_input.json: Context path does not exist" in output
+        assert len(list((tmp_path / "participants").glob("*/output.json"))) == 3
+
+    def test_concurrent_empty_directory(self, tmp_path, capsys):
+        """Test concurrent mode on a directory without JSON files."""
+        exit_code = Main.run_pipeline([str(tmp_path), "concurrent"])
+        output = capsys.readouterr().out
+
+        assert exit_code == 1
+        assert "No JSON files found" in output
+
+    def test_concurrent_matches_sequential(
+        self, tmp_path, golden_participants, capsys
+    ):
+        """Test that concurrent and sequential modes report the same outcome."""
+        configs_dir = create_test_directory_with_files(
+            tmp_path, golden_participants, 4, invalid_indices={0, 3}
+        )
+
+        sequential_exit_code = Main.run_pipeline([str(configs_dir), "sequential"])
+        sequential_output = capsys.readouterr().out
+        concurrent_exit_code = Main.run_pipeline([str(configs_dir), "concurrent"])
+        concurrent_output = capsys.readouterr().out
+
+        assert sequential_exit_code == concurrent_exit_code == 1
+        expected = ("4", "2", "2", "50.0")
+        assert _SUMMARY_RE.search(sequential_output).groups() == expected
+        assert _SUMMARY_RE.search(concurrent_output).groups() == expected
+
+    def test_concurrent_soa_layout(self, tmp_path, golden_participants, capsys):
+        """Test that --soa writes the per-sequence results as parallel arrays."""
+        configs_dir = create_test_directory_with_files(tmp_path, golden_participants, 2)
+
+        exit_code = Main.run_pipeline([str(configs_dir), "concurrent", "--soa"])
+        capsys.readouterr()
+
+        assert exit_code == 0
+        output_files = list((tmp_path / "participants").glob("*/output.json"))
+        assert len(output_files) == 2
+        for output_file in output_files:
+            txt = _loads(output_file.read_bytes())["results"][0]["txt"]
+            assert "sequences" not in txt
+            assert set(txt["sequences_soa"]) == {"gc_content", "codons"}
+            assert len(txt["sequences_soa"]["gc_content"]) == len(DNA_SEQUENCES)
+
+    def test_concurrent_subprocess_smoke(self, tmp_path, golden_participants):
+        """Test the command line entry point end-to-end in a separate interpreter."""
+        configs_dir = create_test_directory_with_files(tmp_path, golden_participants, 3)
+
+        result = subprocess.run(
+            CMD + [str(configs_dir), "concurrent"],
+            cwd=PROJECT_ROOT,
+            env=SUBPROCESS_ENV,
+            capture_output=True,
+        )
+
+        assert result.returncode == 0
+        assert b"Total files processed: 3" in result.stdout
+        assert b"Successful: 3" in result.stdout
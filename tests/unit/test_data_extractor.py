@@ -1,13 +1,23 @@
 import pytest
+import io
 import json
-import tempfile
 import os
-from pathlib import Path
 from Pipeline.DataExtractor import DataExtractor
 from Pipeline.DataModels.ValidPaths import ValidPaths
 from Pipeline.DataModels.DNAData import DNAData
 
 
+def _in_memory_extractor(contents: bytes) -> DataExtractor:
+    """Create a DataExtractor that reads the given contents from memory for any path."""
+    return DataExtractor(
+        opener=lambda path, mode: (
+            io.BytesIO(contents)
+            if "b" in mode
+            else io.TextIOWrapper(io.BytesIO(contents), encoding="utf-8")
+        )
+    )
+
+
 class TestDataExtractor:
     """Unit tests for the DataExtractor component."""
 
@@ -15,7 +25,7 @@ class TestDataExtractor:
         """Set up test fixtures for each test method."""
         self.extractor = DataExtractor()
 
-    def test_extract_metadata_valid_json(self, cleanup_files):
+    def test_extract_metadata_valid_json(self):
         """Test extraction of valid JSON metadata."""
         test_metadata = {
             "participant_id": "test-123",
@@ -25,20 +35,16 @@ class TestDataExtractor:
             "location": "Boston",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(test_metadata, f)
-            metadata_path = f.name
+        extractor = _in_memory_extractor(json.dumps(test_metadata).encode())
 
-        cleanup_files(metadata_path)
-
-        result = self.extractor._extract_metadata(metadata_path)
+        result = extractor._extract_metadata("metadata.json")
 
         assert result == test_metadata
         assert isinstance(result, dict)
         assert result["participant_id"] == "test-123"
         assert result["age"] == 45
 
-    def test_extract_metadata_complex_nested_json(self, cleanup_files):
+    def test_extract_metadata_complex_nested_json(self):
         """Test extraction of complex nested JSON metadata."""
         complex_metadata = {
             "participant": {
@@ -57,36 +63,28 @@ class TestDataExtractor:
             "study": {"id": "DNA-STUDY-001", "phase": 2, "enrolled_date": "2024-01-15"},
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(complex_metadata, f)
-            metadata_path = f.name
-
-        cleanup_files(metadata_path)
+        extractor = _in_memory_extractor(json.dumps(complex_metadata).encode())
 
-        result = self.extractor._extract_metadata(metadata_path)
+        result = extractor._extract_metadata("metadata.json")
 
         assert result == complex_metadata
         assert result["participant"]["demographics"]["age"] == 35
         assert "peanuts" in result["participant"]["medical_history"]["allergies"]
         assert result["study"]["phase"] == 2
 
-    def test_extract_metadata_empty_json(self, cleanup_files):
+    def test_extract_metadata_empty_json(self):
         """Test extraction of empty JSON metadata."""
         empty_metadata = {}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(empty_metadata, f)
-            metadata_path = f.name
-
-        cleanup_files(metadata_path)
+        extractor = _in_memory_extractor(json.dumps(empty_metadata).encode())
 
-        result = self.extractor._extract_metadata(metadata_path)
+        result = extractor._extract_metadata("metadata.json")
 
         assert result == {}
         assert isinstance(result, dict)
         assert len(result) == 0
 
-    def test_extract_dna_valid_sequences(self, cleanup_files):
+    def test_extract_dna_valid_sequences(self, tmp_path):
         """Test extraction of valid DNA sequences from text file."""
         test_sequences = [
             "ATCGCGATCGTAGCTA",
@@ -95,12 +93,8 @@ class TestDataExtractor:
             "CGCGCGCGCGCGCGCG",
         ]
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            for seq in test_sequences:
-                f.write(seq + "\n")
-            dna_path = f.name
-
-        cleanup_files(dna_path)
+        dna_path = tmp_path / "dna.txt"
+        dna_path.write_text("\n".join(test_sequences) + "\n")
 
         result = self.extractor._extract_dna(dna_path)
 
@@ -112,16 +106,13 @@ class TestDataExtractor:
         for i, expected_seq in enumerate(test_sequences):
             assert result.sequences[i] == expected_seq
 
-    def test_extract_dna_with_empty_lines(self, cleanup_files):
+    def test_extract_dna_with_empty_lines(self, tmp_path):
         """Test DNA extraction handles empty lines correctly."""
         dna_content = "ATCGCGATCG\n\nGCTAGCTAGC\n\n\nTTAATTAAGG\n"
         expected_sequences = ["ATCGCGATCG", "GCTAGCTAGC", "TTAATTAAGG"]
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write(dna_content)
-            dna_path = f.name
-
-        cleanup_files(dna_path)
+        dna_path = tmp_path / "dna.txt"
+        dna_path.write_text(dna_content)
 
         result = self.extractor._extract_dna(dna_path)
 
@@ -129,16 +120,13 @@ class TestDataExtractor:
         assert result.sequences == expected_sequences
         assert len(result.sequences) == 3
 
-    def test_extract_dna_with_whitespace(self, cleanup_files):
+    def test_extract_dna_with_whitespace(self, tmp_path):
         """Test DNA extraction handles whitespace correctly."""
         dna_content = "  ATCGCGATCG  \n\t\tGCTAGCTAGC\t\n   TTAATTAAGG   \n"
         expected_sequences = ["ATCGCGATCG", "GCTAGCTAGC", "TTAATTAAGG"]
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write(dna_content)
-            dna_path = f.name
-
-        cleanup_files(dna_path)
+        dna_path = tmp_path / "dna.txt"
+        dna_path.write_text(dna_content)
 
         result = self.extractor._extract_dna(dna_path)
 
@@ -149,13 +137,38 @@ class TestDataExtractor:
         for seq in result.sequences:
             assert seq == seq.strip()
 
-    def test_extract_dna_empty_file(self, cleanup_files):
-        """Test DNA extraction from empty file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            # Write nothing to file
-            dna_path = f.name
+    def test_extract_dna_with_crlf_line_endings(self, tmp_path):
+        """Test DNA extraction from a file with Windows and old Mac line endings."""
+        dna_path = tmp_path / "dna.txt"
+        dna_path.write_bytes(b"ATCGCGATCG\r\n\r\nGCTAGCTAGC\rTTAATTAAGG\r\n")
+
+        result = self.extractor._extract_dna(dna_path)
 
-        cleanup_files(dna_path)
+        assert result.sequences == ["ATCGCGATCG", "GCTAGCTAGC", "TTAATTAAGG"]
+
+    def test_extract_dna_from_in_memory_stream(self):
+        """Test DNA extraction from an in-memory stream."""
+        extractor = _in_memory_extractor(b"ATCGCGATCG\n\n  GCTAGCTAGC \n")
+
+        result = extractor._extract_dna("dna.txt")
+
+        assert isinstance(result, DNAData)
+        assert result.sequences == ["ATCGCGATCG", "GCTAGCTAGC"]
+
+    def test_extract_dna_with_unicode_whitespace(self):
+        """Test that lines of non-ASCII whitespace are dropped, as in a text mode read."""
+        extractor = _in_memory_extractor(
+            "ATCGCGATCG\n\x1c\n\u00a0\u3000\n\u00a0GCTAGCTAGC\x1f\r\n".encode()
+        )
+
+        result = extractor._extract_dna("dna.txt")
+
+        assert result.sequences == ["ATCGCGATCG", "GCTAGCTAGC"]
+
+    def test_extract_dna_empty_file(self, tmp_path):
+        """Test DNA extraction from empty file."""
+        dna_path = tmp_path / "dna.txt"
+        dna_path.write_text("")
 
         result = self.extractor._extract_dna(dna_path)
 
@@ -163,15 +176,12 @@ class TestDataExtractor:
         assert result.sequences == []
         assert len(result.sequences) == 0
 
-    def test_extract_dna_only_empty_lines(self, cleanup_files):
+    def test_extract_dna_only_empty_lines(self, tmp_path):
         """Test DNA extraction from file with only empty lines."""
         dna_content = "\n\n\n\t\t\n   \n"
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write(dna_content)
-            dna_path = f.name
-
-        cleanup_files(dna_path)
+        dna_path = tmp_path / "dna.txt"
+        dna_path.write_text(dna_content)
 
         result = self.extractor._extract_dna(dna_path)
 
@@ -179,15 +189,12 @@ class TestDataExtractor:
         assert result.sequences == []
         assert len(result.sequences) == 0
 
-    def test_extract_dna_single_sequence(self, cleanup_files):
+    def test_extract_dna_single_sequence(self, tmp_path):
         """Test DNA extraction with single sequence."""
         single_sequence = "ATCGCGATCGTAGCTACGCGCGCG"
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write(single_sequence + "\n")
-            dna_path = f.name
-
-        cleanup_files(dna_path)
+        dna_path = tmp_path / "dna.txt"
+        dna_path.write_text(single_sequence + "\n")
 
         result = self.extractor._extract_dna(dna_path)
 
@@ -195,13 +202,8 @@ class TestDataExtractor:
         assert result.sequences == [single_sequence]
         assert len(result.sequences) == 1
 
-    def test_extract_coordinated_extraction(
-        self, temp_metadata_file, temp_dna_file, cleanup_files
-    ):
+    def test_extract_coordinated_extraction(self, temp_metadata_file, temp_dna_file):
         """Test coordinated extraction of both metadata and DNA data."""
-        cleanup_files(temp_metadata_file)
-        cleanup_files(temp_dna_file)
-
         paths = ValidPaths(
             dna_path=temp_dna_file,
             metadata_path=temp_metadata_file,
@@ -221,21 +223,9 @@ class TestDataExtractor:
         assert len(dna_data.sequences) > 0
         assert all(isinstance(seq, str) for seq in dna_data.sequences)
 
-    def test_extract_with_real_fixtures(self, cleanup_files):
+    def test_extract_with_real_fixtures(self, real_fixture_extract):
         """Test extraction using real fixture files."""
-        # Use actual fixture files
-        fixtures_dir = Path(__file__).parent.parent / "fixtures"
-        metadata_path = fixtures_dir / "sample_metadata.json"
-        dna_path = fixtures_dir / "sample_dna.txt"
-
-        paths = ValidPaths(
-            dna_path=str(dna_path),
-            metadata_path=str(metadata_path),
-            context_path="/tmp/test",
-            output_path="/tmp/test_output.json",
-        )
-
-        metadata, dna_data = self.extractor.extract(paths)
+        metadata, dna_data = real_fixture_extract
 
         # Verify metadata structure
         assert isinstance(metadata, dict)
@@ -254,7 +244,7 @@ class TestDataExtractor:
                 char in valid_chars for char in sequence
             ), f"Invalid characters in sequence: {sequence}"
 
-    def test_extract_preserves_data_types_in_metadata(self, cleanup_files):
+    def test_extract_preserves_data_types_in_metadata(self):
         """Test that metadata extraction preserves various data types."""
         test_metadata = {
             "participant_id": "type-test-789",
@@ -266,13 +256,9 @@ class TestDataExtractor:
             "metadata": {"study_phase": 2, "enrolled": True},  # nested dict
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(test_metadata, f)
-            metadata_path = f.name
+        extractor = _in_memory_extractor(json.dumps(test_metadata).encode())
 
-        cleanup_files(metadata_path)
-
-        result = self.extractor._extract_metadata(metadata_path)
+        result = extractor._extract_metadata("metadata.json")
 
         # Verify data types are preserved
         assert isinstance(result["age"], int)
@@ -284,17 +270,13 @@ class TestDataExtractor:
         assert isinstance(result["metadata"]["study_phase"], int)
         assert isinstance(result["metadata"]["enrolled"], bool)
 
-    def test_extract_large_dna_file(self, cleanup_files):
+    def test_extract_large_dna_file(self, tmp_path):
         """Test extraction of larger DNA files."""
         # Generate many sequences
         large_sequences = [f"ATCG{'CGAT' * 25}{i:04d}" for i in range(100)]
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            for seq in large_sequences:
-                f.write(seq + "\n")
-            dna_path = f.name
-
-        cleanup_files(dna_path)
+        dna_path = tmp_path / "dna.txt"
+        dna_path.write_text("\n".join(large_sequences) + "\n")
 
         result = self.extractor._extract_dna(dna_path)
 
@@ -303,7 +285,7 @@ class TestDataExtractor:
         assert result.sequences[0].endswith("0000")
         assert result.sequences[99].endswith("0099")
 
-    def test_extract_metadata_with_unicode_characters(self, cleanup_files):
+    def test_extract_metadata_with_unicode_characters(self):
         """Test metadata extraction with unicode characters."""
         unicode_metadata = {
             "participant_name": "José María García",
@@ -313,17 +295,42 @@ class TestDataExtractor:
             "emoji": "🧬 DNA study participant",
         }
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False, encoding="utf-8"
-        ) as f:
-            json.dump(unicode_metadata, f, ensure_ascii=False)
-            metadata_path = f.name
-
-        cleanup_files(metadata_path)
+        extractor = _in_memory_extractor(
+            json.dumps(unicode_metadata, ensure_ascii=False).encode("utf-8")
+        )
 
-        result = self.extractor._extract_metadata(metadata_path)
+        result = extractor._extract_metadata("metadata.json")
 
         assert result == unicode_metadata
         assert result["participant_name"] == "José María García"
         assert result["location"] == "São Paulo"
         assert "🧬" in result["emoji"]
+
+    def test_extract_metadata_keeps_wide_integers_exact(self):
+        """Test that integers wider than 64 bits are parsed exactly, as by the stdlib parser."""
+        raw_metadata = (
+            b'{"big": 123456789012345678901234567890, "negative": -9223372036854775809,'
+            b' "max_unsigned": 18446744073709551615, "phone": "5551234567890123456789"}'
+        )
+        extractor = _in_memory_extractor(raw_metadata)
+
+        result = extractor._extract_metadata("metadata.json")
+
+        assert result == json.loads(raw_metadata)
+        assert isinstance(result["big"], int)
+        assert isinstance(result["negative"], int)
+
+    def test_extract_metadata_out_of_range_float_matches_stdlib(self):
+        """Test that numbers the fast parsers reject are still parsed by the stdlib parser."""
+        extractor = _in_memory_extractor(b'{"huge": 1e400}')
+
+        result = extractor._extract_metadata("metadata.json")
+
+        assert result == {"huge": float("inf")}
+
+    def test_extract_metadata_invalid_json_raises_stdlib_error(self):
+        """Test that malformed metadata is reported by the stdlib parser."""
+        extractor = _in_memory_extractor(b'{"name": "John",}')
+
+        with pytest.raises(json.JSONDecodeError):
+            extractor._extract_metadata("metadata.json")
@@ -1,6 +1,25 @@
 import pytest
+from itertools import combinations
 from Pipeline.Transform.DNAProcessor import DNAProcessor
 from Pipeline.DataModels.DNAData import DNAData
+from Constants import SHORT_SEQUENCE_LENGTH
+
+
+def _unpruned_find_lcs(processor, sequences):
+    """Reference LCS search comparing every pair, without pruning or candidate filtering."""
+    results = []
+    for i, j in combinations(range(len(sequences)), 2):
+        lcs_value = processor._longest_common_subsequence(sequences[i], sequences[j])
+        if lcs_value:
+            participants = [
+                k + 1 for k in range(len(sequences)) if lcs_value in sequences[k]
+            ]
+            results.append(
+                {"value": lcs_value, "sequences": participants, "length": len(lcs_value)}
+            )
+    if not results:
+        return {"value": "", "sequences": [], "length": 0}
+    return max(results, key=lambda x: (x["length"], len(x["sequences"])))
 
 
 class TestDNAProcessor:
@@ -60,6 +79,13 @@ class TestDNAProcessor:
         assert result["gc_content"] == 0.0  # No G or C
         assert result["codons"] == {}  # No complete codons
 
+    def test_analyze_sequence_empty_sequence(self):
+        """Test that an empty sequence has no GC content instead of dividing by zero."""
+        result = self.processor._analyze_sequence("")
+
+        assert result["gc_content"] == 0.0
+        assert result["codons"] == {}
+
     def test_longest_common_subsequence_found(self):
         """Test LCS finding with common subsequences."""
         seq1 = "ATCGCAT"
@@ -226,3 +252,121 @@ class TestDNAProcessor:
             assert (
                 result["codons"] == expected_codons
             ), f"Failed for sequence {sequence}"
+
+    def test_transform_long_sequence_matches_short_path(self, monkeypatch):
+        """Test that sequences counted with Counter match the plain dict counting path."""
+        # 152 bases: 50 complete codons, GCG and ATC tied at 25, and a trailing "TT"
+        dna_data = DNAData()
+        dna_data.sequences = ["GCG" * 20 + "ATC" * 25 + "GCG" * 5 + "TT"]
+        assert len(dna_data.sequences[0]) >= SHORT_SEQUENCE_LENGTH
+
+        counter_processor = DNAProcessor()
+        counter_result = counter_processor.transform_dna(dna_data)
+
+        # Raise the threshold so the same sequence is counted with the plain dict
+        monkeypatch.setattr(
+            "Pipeline.Transform.DNAProcessor.SHORT_SEQUENCE_LENGTH",
+            len(dna_data.sequences[0]) + 1,
+        )
+        dict_processor = DNAProcessor()
+        dict_result = dict_processor.transform_dna(dna_data)
+
+        counter_codons = counter_result["sequences"][0]["codons"]
+        assert counter_codons == {"GCG": 25, "ATC": 25}
+        assert list(counter_codons.items()) == list(
+            dict_result["sequences"][0]["codons"].items()
+        )
+        assert counter_processor.codon_frequencies == dict_processor.codon_frequencies
+        assert counter_result["most_common_codon"] == "GCG"
+        assert dict_result["most_common_codon"] == "GCG"
+
+    @pytest.mark.parametrize(
+        "sequences, expected_codon",
+        [
+            (["ATCATC", "GCGGCG"], "ATC"),
+            (["GCGGCG", "ATCATC"], "GCG"),
+            (["ATCATC", "GCG", "GCG"], "ATC"),
+            (["GCGATC", "ATCGCG"], "GCG"),
+        ],
+    )
+    def test_most_common_codon_tie_goes_to_first_seen(self, sequences, expected_codon):
+        """Test that codons tied across sequences resolve to the codon seen first."""
+        dna_data = DNAData()
+        dna_data.sequences = sequences
+
+        result = self.processor.transform_dna(dna_data)
+
+        frequencies = self.processor.codon_frequencies
+        assert result["most_common_codon"] == expected_codon
+        assert expected_codon == max(frequencies, key=frequencies.get)
+
+    def test_most_common_codon_tie_across_transformations(self):
+        """Test that a tie reached over two transform_dna calls keeps the first-seen codon."""
+        first_batch = DNAData()
+        first_batch.sequences = ["TTAGCGGCG"]  # TTA once, GCG twice
+        second_batch = DNAData()
+        second_batch.sequences = ["TTATTAGCG"]  # TTA catches up with GCG at 3
+
+        first_result = self.processor.transform_dna(first_batch)
+        second_result = self.processor.transform_dna(second_batch)
+
+        frequencies = self.processor.codon_frequencies
+        assert first_result["most_common_codon"] == "GCG"
+        assert frequencies == {"TTA": 3, "GCG": 3}
+        assert second_result["most_common_codon"] == "TTA"
+        assert second_result["most_common_codon"] == max(
+            frequencies, key=frequencies.get
+        )
+
+    def test_reset_clears_codon_statistics(self):
+        """Test that reset clears the global codon counts and the running most common codon."""
+        dna_data = DNAData()
+        dna_data.sequences = ["ATCATCGCG"]
+        self.processor.transform_dna(dna_data)
+
+        self.processor.reset()
+
+        assert self.processor.codon_frequencies == {}
+        assert self.processor._codon_ranks == {}
+        assert self.processor._top_codon is None
+        assert self.processor._top_count == 0
+        dna_data.sequences = ["GCG"]
+        assert self.processor.transform_dna(dna_data)["most_common_codon"] == "GCG"
+
+    def test_find_lcs_skips_pairs_shorter_than_best(self):
+        """Test that pruning pairs too short to beat the best LCS doesn't change the result."""
+        dna_data = DNAData()
+        dna_data.sequences = [
+            "ATCGATCGGGTACCAT",
+            "TTATCGATCGGGTACA",
+            "AC",
+            "GT",
+            "CGA",
+            "GGATCGATCGGGTTTT",
+        ]
+        compared_pairs = []
+        longest_common_subsequence = self.processor._longest_common_subsequence
+
+        def counting_lcs(seq1, seq2):
+            compared_pairs.append((seq1, seq2))
+            return longest_common_subsequence(seq1, seq2)
+
+        self.processor._longest_common_subsequence = counting_lcs
+        result = self.processor._find_lcs(dna_data)
+
+        # 15 pairs in total, only the 3 pairs of long sequences are long enough to compare
+        assert len(compared_pairs) == 3
+        assert result == _unpruned_find_lcs(DNAProcessor(), dna_data.sequences)
+        assert result["length"] > len("CGA")
+
+    def test_find_lcs_equal_length_candidates_prefer_most_sequences(self):
+        """Test that among equal-length LCS values the one found in most sequences wins."""
+        dna_data = DNAData()
+        # Pairwise LCS values of length 3: "TTG" (in sequences 2 and 3) is found first,
+        # "GTT" (in sequences 2, 3 and 4) is found twice
+        dna_data.sequences = ["CGGGC", "GTTTTG", "CTGTTGA", "GTTA"]
+
+        result = self.processor._find_lcs(dna_data)
+
+        assert result == {"value": "GTT", "sequences": [2, 3, 4], "length": 3}
+        assert result == _unpruned_find_lcs(DNAProcessor(), dna_data.sequences)
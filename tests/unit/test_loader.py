@@ -1,6 +1,4 @@
 import pytest
-import json
-import tempfile
 import os
 from datetime import datetime
 from pathlib import Path
@@ -8,6 +6,11 @@ from Pipeline.Loader import Loader
 from Pipeline.DataModels.ValidPaths import ValidPaths
 from Exceptions.LoaderExceptions import LoaderException
 
+try:
+    from orjson import loads as _loads
+except ImportError:  # Fall back to the stdlib when orjson is not installed
+    from json import loads as _loads
+
 
 class TestLoader:
     """Unit tests for the Loader component."""
@@ -17,7 +20,7 @@ class TestLoader:
         self.loader = Loader()
 
     def test_create_output_success(
-        self, sample_metadata, sample_dna_sequences, cleanup_files
+        self, sample_metadata, sample_dna_sequences, output_path
     ):
         """Test successful output file creation."""
         # Setup
@@ -25,11 +28,6 @@ class TestLoader:
         end_time = datetime.now()
         participant_id = "test-participant-123"
 
-        # Create temporary output file path
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            output_path = f.name
-        cleanup_files(output_path)
-
         # Create sample DNA data structure (as returned by DNAProcessor)
         dna_data = {
             "sequences": [
@@ -60,8 +58,7 @@ class TestLoader:
         # Assert
         assert Path(output_path).exists()
 
-        with open(output_path, "r") as f:
-            output_data = json.load(f)
+        output_data = _loads(Path(output_path).read_bytes())
 
         # Verify structure
         assert "metadata" in output_data
@@ -94,20 +91,18 @@ class TestLoader:
         # Verify metadata is preserved
         assert result["json"] == sample_metadata
 
-    def test_create_output_json_formatting(self, sample_metadata, cleanup_files):
+    def test_create_output_json_formatting(
+        self, sample_metadata, output_path, mem_loader
+    ):
         """Test that output JSON is properly formatted with indentation."""
         start_time = datetime.now()
         end_time = datetime.now()
         participant_id = "test-format-123"
 
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            output_path = f.name
-        cleanup_files(output_path)
-
         dna_data = {"sequences": [], "most_common_codon": "", "lcs": {}}
         paths = ValidPaths("/tmp/dna", "/tmp/meta", "/tmp/context", output_path)
 
-        self.loader.create_output(
+        mem_loader.create_output(
             meta_data=sample_metadata,
             dna_data=dna_data,
             paths=paths,
@@ -116,12 +111,11 @@ class TestLoader:
             participant_id=participant_id,
         )
 
-        # Read raw file content to check formatting
-        with open(output_path, "r") as f:
-            content = f.read()
+        # Check the formatting on the raw output content
+        content = mem_loader.outputs[output_path].decode("utf-8")
 
-        # Should have proper indentation (4 spaces)
-        assert "    " in content  # Check for indentation
+        # Should have proper indentation (2 spaces)
+        assert "  " in content  # Check for indentation
         assert content.count("\n") > 5  # Should have multiple lines due to formatting
 
     def test_create_output_invalid_path_raises_exception(self, sample_metadata):
@@ -168,14 +162,12 @@ class TestLoader:
                 participant_id=participant_id,
             )
 
-    def test_create_output_timing_precision(self, sample_metadata, cleanup_files):
+    def test_create_output_timing_precision(
+        self, sample_metadata, output_path, mem_loader
+    ):
         """Test that timing information is captured accurately."""
         participant_id = "test-timing-123"
 
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            output_path = f.name
-        cleanup_files(output_path)
-
         # Use specific timestamps
         start_time = datetime(2024, 1, 15, 10, 30, 45)
         end_time = datetime(2024, 1, 15, 10, 35, 20)
@@ -183,7 +175,7 @@ class TestLoader:
         dna_data = {"sequences": [], "most_common_codon": "", "lcs": {}}
         paths = ValidPaths("/tmp/dna", "/tmp/meta", "/tmp/context", output_path)
 
-        self.loader.create_output(
+        mem_loader.create_output(
             meta_data=sample_metadata,
             dna_data=dna_data,
             paths=paths,
@@ -192,22 +184,17 @@ class TestLoader:
             participant_id=participant_id,
         )
 
-        with open(output_path, "r") as f:
-            output_data = json.load(f)
+        output_data = _loads(mem_loader.outputs[output_path])
 
         # Verify timestamps are correctly formatted
         metadata = output_data["metadata"]
         assert str(start_time) in metadata["start_at"]
         assert str(end_time) in metadata["end_at"]
 
-    def test_create_output_large_data_handling(self, cleanup_files):
+    def test_create_output_large_data_handling(self, output_path):
         """Test handling of large datasets."""
         participant_id = "test-large-123"
 
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            output_path = f.name
-        cleanup_files(output_path)
-
         # Create large dataset
         large_metadata = {f"field_{i}": f"value_{i}" for i in range(1000)}
         large_dna_data = {
@@ -239,20 +226,74 @@ class TestLoader:
 
         # Verify file exists and is readable
         assert Path(output_path).exists()
-        with open(output_path, "r") as f:
-            output_data = json.load(f)
+        output_data = _loads(Path(output_path).read_bytes())
 
         assert len(output_data["results"][0]["json"]) == 1000
         assert len(output_data["results"][0]["txt"]["sequences"]) == 100
 
-    def test_create_output_empty_data_handling(self, cleanup_files):
+    def test_create_output_soa_layout(self, sample_metadata, output_path, mem_loader):
+        """Test that the SoA layout writes one array per sequence field."""
+        dna_data = {
+            "sequences": [
+                {"gc_content": 50.0, "codons": {"ATG": 1}},
+                {"gc_content": 25.0, "codons": {"TTA": 2}},
+            ],
+            "most_common_codon": "ATG",
+            "lcs": {"value": "AT", "length": 2, "sequences": [1, 2]},
+        }
+        paths = ValidPaths("/tmp/dna", "/tmp/meta", "/tmp/context", output_path)
+
+        mem_loader.soa = True
+        mem_loader.create_output(
+            meta_data=sample_metadata,
+            dna_data=dna_data,
+            paths=paths,
+            start_time=datetime.now(),
+            end_time=datetime.now(),
+            participant_id="test-soa-123",
+        )
+
+        txt = _loads(mem_loader.outputs[output_path])["results"][0]["txt"]
+        assert "sequences" not in txt
+        assert txt["sequences_soa"] == {
+            "gc_content": [50.0, 25.0],
+            "codons": [{"ATG": 1}, {"TTA": 2}],
+        }
+        assert txt["most_common_codon"] == "ATG"
+        assert txt["lcs"] == dna_data["lcs"]
+
+    @pytest.mark.parametrize(
+        "dna_data, expected_txt",
+        [
+            ({}, {}),
+            ({"sequences": [], "lcs": {}}, {"sequences_soa": {}, "lcs": {}}),
+            ({"sequences": ["ATG", None]}, {"sequences": ["ATG", None]}),
+        ],
+        ids=["missing_sequences", "empty_sequences", "non_dict_sequences"],
+    )
+    def test_create_output_soa_layout_without_sequence_results(
+        self, sample_metadata, output_path, mem_loader, dna_data, expected_txt
+    ):
+        """Test that the SoA layout handles missing, empty and non-dict sequence results."""
+        paths = ValidPaths("/tmp/dna", "/tmp/meta", "/tmp/context", output_path)
+
+        mem_loader.soa = True
+        mem_loader.create_output(
+            meta_data=sample_metadata,
+            dna_data=dna_data,
+            paths=paths,
+            start_time=datetime.now(),
+            end_time=datetime.now(),
+            participant_id="test-soa-empty-123",
+        )
+
+        txt = _loads(mem_loader.outputs[output_path])["results"][0]["txt"]
+        assert txt == expected_txt
+
+    def test_create_output_empty_data_handling(self, output_path, mem_loader):
         """Test handling of empty or minimal data."""
         participant_id = "test-empty-123"
 
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            output_path = f.name
-        cleanup_files(output_path)
-
         # Empty data structures
         empty_metadata = {}
         empty_dna_data = {}
@@ -261,7 +302,7 @@ class TestLoader:
         end_time = datetime.now()
         paths = ValidPaths("/tmp/dna", "/tmp/meta", "/tmp/context", output_path)
 
-        self.loader.create_output(
+        mem_loader.create_output(
             meta_data=empty_metadata,
             dna_data=empty_dna_data,
             paths=paths,
@@ -270,8 +311,7 @@ class TestLoader:
             participant_id=participant_id,
         )
 
-        with open(output_path, "r") as f:
-            output_data = json.load(f)
+        output_data = _loads(mem_loader.outputs[output_path])
 
         # Should still have proper structure
         assert "metadata" in output_data
@@ -279,3 +319,93 @@ class TestLoader:
         assert output_data["results"][0]["participant"]["_id"] == participant_id
         assert output_data["results"][0]["json"] == {}
         assert output_data["results"][0]["txt"] == {}
+
+    @pytest.mark.parametrize(
+        "use_orjson, expected_lines",
+        [
+            (False, ['"large": 1e+16,', '"small": 1e-07,', '"nan": NaN,', '"1": 2']),
+            (True, ['"large": 1e16,', '"small": 1e-7,', '"nan": null,', '"1": 2']),
+        ],
+        ids=["json_fallback", "orjson"],
+    )
+    def test_create_output_float_and_key_encoding(
+        self, output_path, mem_loader, monkeypatch, use_orjson, expected_lines
+    ):
+        """Test how each encoder writes exponent floats, NaN and non-string keys."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr("Pipeline.Loader.orjson", None)
+        dna_data = {
+            "large": 1e16,
+            "small": 1e-7,
+            "nan": float("nan"),
+            "codons": {1: 2},
+        }
+        paths = ValidPaths("/tmp/dna", "/tmp/meta", "/tmp/context", output_path)
+
+        mem_loader.create_output(
+            meta_data={},
+            dna_data=dna_data,
+            paths=paths,
+            start_time=datetime.now(),
+            end_time=datetime.now(),
+            participant_id="test-encoding-123",
+        )
+
+        content = mem_loader.outputs[output_path].decode("utf-8")
+        for expected_line in expected_lines:
+            assert expected_line in content
+
+    def test_create_outputs_batch(self, sample_metadata, tmp_path):
+        """Test that a batch of participants is written to their own output files."""
+        start_time = datetime.now()
+        end_time = datetime.now()
+        dna_data = {"sequences": [], "most_common_codon": "", "lcs": {}}
+        jobs = [
+            (
+                sample_metadata,
+                dna_data,
+                ValidPaths(
+                    "/tmp/dna", "/tmp/meta", "/tmp/context", str(tmp_path / f"{i}.json")
+                ),
+                start_time,
+                end_time,
+                f"participant-{i}",
+            )
+            for i in range(20)
+        ]
+
+        self.loader.create_outputs(jobs)
+
+        for i in range(20):
+            output_data = _loads((tmp_path / f"{i}.json").read_bytes())
+            assert output_data["results"][0]["participant"]["_id"] == f"participant-{i}"
+
+    def test_create_outputs_batch_failure_raises_exception(
+        self, sample_metadata, tmp_path
+    ):
+        """Test that a failing job raises LoaderException after the others are written."""
+        start_time = datetime.now()
+        end_time = datetime.now()
+        dna_data = {"sequences": [], "most_common_codon": "", "lcs": {}}
+        output_paths = [
+            str(tmp_path / "nonexistent" / "failed.json"),
+            str(tmp_path / "written.json"),
+        ]
+        jobs = [
+            (
+                sample_metadata,
+                dna_data,
+                ValidPaths("/tmp/dna", "/tmp/meta", "/tmp/context", output_path),
+                start_time,
+                end_time,
+                f"participant-{i}",
+            )
+            for i, output_path in enumerate(output_paths)
+        ]
+
+        with pytest.raises(LoaderException):
+            self.loader.create_outputs(jobs)
+
+        assert (tmp_path / "written.json").exists()
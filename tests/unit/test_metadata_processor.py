@@ -188,6 +188,14 @@ class TestMetaDataProcessor:
         assert "__dunder" not in result
         assert "_" not in result
 
+    def test_remove_private_keys_keeps_empty_key(self):
+        """Test that an empty key is not treated as private."""
+        metadata = {"": "empty_key", "_hidden": "hidden", "nested": {"": 0}}
+
+        result = self.processor.remove_private_keys(metadata)
+
+        assert result == {"": "empty_key", "nested": {"": 0}}
+
     def test_remove_private_keys_complex_real_world_example(
         self, sample_metadata_with_private
     ):